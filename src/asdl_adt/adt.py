@@ -4,62 +4,145 @@ This is the main parsing and class metaprogramming module in ASDL-ADT.
 from __future__ import annotations
 
 import functools
-import inspect
 import sys
 import textwrap
 import typing
+import weakref
 from abc import ABC, abstractmethod
-from collections import OrderedDict
 from types import ModuleType
-from typing import Any, Mapping, Callable, Optional, Collection, List, Union, Type
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Mapping,
+    Callable,
+    Optional,
+    Collection,
+    List,
+    NamedTuple,
+    Tuple,
+    Union,
+    Type,
+)
 
 import asdl
 import attrs
 
-from asdl_adt.validators import ValidationError, instance_of, subclass_of
+from asdl_adt.validators import (
+    ValidationError,
+    _instance_check,
+    instance_of,
+    subclass_of,
+)
 
 
-def _normalize(func):
-    signature = inspect.signature(func)
+@functools.lru_cache(maxsize=None)
+def _compile_source(source: str):
+    # Constructors with the same field names and checks generate the same source,
+    # so their code objects can be shared and only the globals rebound.
+    return compile(source, "<asdl-adt>", "exec", optimize=2)
 
-    @functools.wraps(func)
-    def _func(*args, **kwargs):
-        call = signature.bind(*args, **kwargs)
-        return func(*call.args, **call.kwargs)
 
-    return _func
+@functools.lru_cache(maxsize=None)
+def _intern_names(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Many constructors share field names (e.g. lhs, rhs); let their classes share
+    # one tuple rather than each holding a copy.
+    return names
 
 
-def _make_validator(point_valid, seq: bool, opt: bool):
+def _validate_opt(valid):
     def validate(val):
-        if val is None and opt:
+        if val is None:
             return val
+        return valid(val)
+
+    return validate
 
-        if seq:
-            if not isinstance(val, list):
-                raise ValidationError(list, type(val))
-            try:
-                return [point_valid(y) for y in val]
-            except ValidationError as err:
-                raise ValidationError(List[err.expected], List[err.actual]) from err
 
-        return point_valid(val)
+def _validate_seq(point_valid):
+    def validate(val):
+        if not isinstance(val, list):
+            raise ValidationError(list, type(val))
+        try:
+            return [point_valid(y) for y in val]
+        except ValidationError as err:
+            raise ValidationError(List[err.expected], List[err.actual]) from err
 
     return validate
 
 
-# pylint: disable=too-few-public-methods
+def _make_validator(valid, seq: bool, opt: bool):
+    # The seq and opt flags are resolved here, by composing specialized validators,
+    # so the validators themselves never branch on them. Plain fields use the
+    # point validator as is.
+    if seq:
+        valid = _validate_seq(valid)
+    if opt:
+        valid = _validate_opt(valid)
+    return valid
+
+
+class _InlineCheck(NamedTuple):
+    """
+    A field check emitted directly into the generated __init__, for fields whose
+    elements only need an isinstance check against a class. For sum types, "ctors"
+    is the set of their constructor classes, which is filled in as they are built.
+    With "convert", other values are converted by calling the class, as with
+    instance_of(..., convert=True).
+    """
+
+    typ: type
+    seq: bool
+    opt: bool
+    ctors: Optional[AbstractSet[type]] = None
+    convert: bool = False
+
+
+class _MemoCache(dict):
+    """
+    A memo table for the generated __new__ of memoized classes, mapping argument
+    tuples to weak references to the instances built from them. Each entry is
+    removed as soon as its instance dies, so the key tuple does not keep the
+    instance's arguments (often other nodes) alive.
+    """
+
+    __slots__ = ()
+
+    def store(self, key, val):
+        """
+        Record val as the memoized instance for key.
+        """
+
+        def discard(ref):
+            # The entry may have been replaced by a newer instance in the meantime.
+            if self.get(key) is ref:
+                del self[key]
+
+        self[key] = weakref.ref(val, discard)
+
+
 class _AsdlAdtBase(ABC):
+    # Kept empty so that mixins may declare slots of their own; the slots for the
+    # cached hash and weak references are added to each concrete class instead.
+    __slots__ = ()
+
+    # The field names of a generated class, in constructor order.
+    __match_args__: Tuple[str, ...] = ()
+
     @abstractmethod
     def __init__(self):  # pragma: no cover (unreachable)
         assert False, "Should be unreachable."
 
-    def update(self, **kwargs):
-        """
-        Useful wrapper for creating a copy of an instance of a generated class,
-        with only certain fields changed.
-        """
-        return attrs.evolve(self, **kwargs)
+    def __setattr__(self, name, value):
+        raise attrs.exceptions.FrozenInstanceError()
+
+    def __delattr__(self, name):
+        raise attrs.exceptions.FrozenInstanceError()
+
+    def __reduce__(self):
+        # Rebuild copies through the constructor, since the default protocol would
+        # need __setattr__ (and a no-argument __new__ for memoized classes).
+        return type(self), tuple(getattr(self, f) for f in self.__match_args__)
 
 
 class _BuildClasses(asdl.VisitorBase):
@@ -78,77 +161,279 @@ class _BuildClasses(asdl.VisitorBase):
         ext_types: Optional[Mapping[str, type]] = None,
         mixin_types: Optional[Mapping[str, type]] = None,
         memoize: Optional[Collection[str]] = None,
+        checks: bool = True,
     ):
         super().__init__()
         self.module: Optional[ModuleType] = None
 
         self._mixin_types = mixin_types or {}
         self._memoize = memoize or set()
+        self._checks = checks
         self._type_map = {
             **_BuildClasses._builtin_types,
             **(ext_types or {}),
         }
-        self._base_types = {}
+        self._ctor_types = {}
+        self._validators = {}
 
     @staticmethod
     def _make_function(name: str, args: List[str], body: List[str], **context):
         body = body or ["pass"]
-        body = textwrap.indent("\n".join(body), " " * 4)
-        source = f'def {name}({", ".join(args)}):\n' + body
+        source = f'def {name}({", ".join(args)}):\n    ' + "\n    ".join(body)
         # exec required because Python functions can't have dynamically named arguments.
-        exec(source, context)  # pylint: disable=W0122
+        exec(_compile_source(source), context)  # pylint: disable=W0122
         return context[name]
 
     @staticmethod
-    def _init_fn(fields: OrderedDict[str, Any]):
+    def _init_fn(typ: type, fields: Dict[str, Any]):
         """
-        Make an __init__ method that can be injected into a class.
+        Make an __init__ method that can be injected into a class. Fields are written
+        through the class's slot descriptors, which are bound once here rather than
+        looked up by name on every construction.
         """
-        context = {}
+        context = {"ValidationError": ValidationError, "List": List}
         body = []
 
         for name, validator in fields.items():
-            if validator:
+            if isinstance(validator, _InlineCheck):
+                context[f"_type_{name}"] = validator.typ
+                context[f"_ctors_{name}"] = validator.ctors
+                body.extend(_BuildClasses._inline_check(name, validator))
+            elif validator:
                 context[f"_validate_{name}"] = validator
                 body.append(f"{name} = _validate_{name}({name})")
 
-            body.append(f"object.__setattr__(self, '{name}', {name})")
+            context[f"_set_{name}"] = getattr(typ, name).__set__
+            body.append(f"_set_{name}(self, {name})")
 
         args = ["self"] + list(fields)
         return _BuildClasses._make_function("__init__", args, body, **context)
 
     @staticmethod
-    def _cached_new_fn(supertype, fields):
-        new_function = _BuildClasses._make_function(
+    def _inline_check(name: str, check: _InlineCheck) -> List[str]:
+        """
+        Source lines for an isinstance check of the given field, against the class
+        bound to _type_<name>, raising the same errors as the equivalent validator.
+        Every value is an object, so for object only None is checked for.
+
+        Values of a sum type are never instances of the (abstract) sum class itself,
+        so isinstance always takes the slow ABC path for them. Looking the exact type
+        up in the sum's constructor set first is much faster.
+        """
+
+        def invalid(val):
+            if check.typ is object:
+                return f"{val} is None"
+            if check.ctors is not None:
+                return (
+                    f"type({val}) not in _ctors_{name}"
+                    f" and not isinstance({val}, _type_{name})"
+                )
+            return f"not isinstance({val}, _type_{name})"
+
+        if check.seq:
+            lines = [
+                f"if not isinstance({name}, list):",
+                f"    raise ValidationError(list, type({name}))",
+                f"for _elt in {name}:",
+                f"    if {invalid('_elt')}:",
+                f"        raise ValidationError(List[_type_{name}], List[type(_elt)])",
+                # Store a copy, as validators do, so the caller's list is not aliased.
+                f"{name} = list({name})",
+            ]
+        elif check.convert:
+            lines = [
+                f"if {invalid(name)}:",
+                f"    if {name} is None:",
+                f"        raise ValidationError(_type_{name}, type({name}))",
+                f"    {name} = _type_{name}({name})",
+            ]
+        else:
+            lines = [
+                f"if {invalid(name)}:",
+                f"    raise ValidationError(_type_{name}, type({name}))",
+            ]
+        if check.opt:
+            lines = [f"if {name} is not None:"] + [f"    {line}" for line in lines]
+        return lines
+
+    @staticmethod
+    def _eq_fn(fields: Tuple[str, ...]):
+        """
+        Make an __eq__ method comparing all fields at once as a tuple. Memoized
+        instances with equal arguments are identical, so identity is checked first.
+        """
+        self_fields = "".join(f"self.{name}, " for name in fields)
+        other_fields = "".join(f"other.{name}, " for name in fields)
+        body = [
+            "if other is self:",
+            "    return True",
+            "if other.__class__ is not self.__class__:",
+            "    return NotImplemented",
+            f"return ({self_fields}) == ({other_fields})",
+        ]
+        return _BuildClasses._make_function("__eq__", ["self", "other"], body)
+
+    @staticmethod
+    def _hash_fn(typ: type, fields: Tuple[str, ...]):
+        """
+        Make a __hash__ method consistent with the __eq__ made by _eq_fn. Instances
+        are immutable, so the hash is computed once and then cached.
+        """
+        self_fields = "".join(f", self.{name}" for name in fields)
+        body = [
+            "try:",
+            "    return self._hash",
+            "except AttributeError:",
+            "    pass",
+            f"h = hash((_cls{self_fields}))",
+            "_set_hash(self, h)",
+            "return h",
+        ]
+        return _BuildClasses._make_function(
+            "__hash__",
+            ["self"],
+            body,
+            _cls=typ,
+            _set_hash=getattr(typ, "_hash").__set__,
+        )
+
+    @staticmethod
+    def _repr_fn(typ: type, fields: Tuple[str, ...]):
+        """
+        Make a __repr__ method in the same format as attrs, with the constant parts
+        of the string folded into a single f-string.
+        """
+        args = ", ".join(f"{name}={{self.{name}!r}}" for name in fields)
+        body = [f'return f"{{_name}}({args})"']
+        return _BuildClasses._make_function(
+            "__repr__", ["self"], body, _name=typ.__qualname__
+        )
+
+    @staticmethod
+    def _update_fn(fields: Tuple[str, ...]):
+        """
+        Make an update method that passes each field on to the constructor directly.
+        Popping the fields leaves any unknown names in kwargs, for the constructor to
+        reject. The constructor is looked up on the instance, so user subclasses get
+        copies of their own class.
+        """
+        args = "".join(f"kwargs.pop({name!r}, self.{name}), " for name in fields)
+        body = [f"return self.__class__({args}**kwargs)"]
+        func = _BuildClasses._make_function("update", ["self", "**kwargs"], body)
+        # Sources are compiled with optimize=2, which strips docstrings.
+        func.__doc__ = (
+            "Useful wrapper for creating a copy of an instance of a generated class, "
+            "with only certain fields changed."
+        )
+        return func
+
+    @staticmethod
+    def _set_method(typ: type, func):
+        # Code objects are shared between classes, so the owning class is only
+        # recorded on the function object.
+        func.__qualname__ = f"{typ.__qualname__}.{func.__name__}"
+        setattr(typ, func.__name__, func)
+
+    def _attach_init(self, cls: type, fields: Dict[str, Any]):
+        self._set_method(cls, self._init_fn(cls, fields))
+        cls.__abstractmethods__ = frozenset(set(cls.__abstractmethods__) - {"__init__"})
+
+    @staticmethod
+    def _cached_new_fn(supertype, fields: List[asdl.Field]):
+        """
+        Make a __new__ method that returns the same instance for equal arguments,
+        for as long as that instance is alive. Binding the arguments by name means
+        keyword and positional calls share one cache entry. The key includes the
+        class, since subclasses inherit this __new__ and its cache. Sequence arguments
+        are keyed by their contents as a tuple. Without fields, there is only ever one
+        instance per class, and it is kept alive by the class.
+        """
+        if not fields:
+            return _BuildClasses._make_function(
+                "__new__",
+                ["cls"],
+                [
+                    "val = _instances.get(cls)",
+                    "if val is None:",
+                    "    val = _instances[cls] = _base_new(cls)",
+                    "return val",
+                ],
+                _base_new=super(supertype, supertype).__new__,
+                _instances={},
+            )
+
+        key = "".join(
+            f"tuple({f.name}) if isinstance({f.name}, list) else {f.name}, "
+            if f.seq
+            else f"{f.name}, "
+            for f in fields
+        )
+        body = [
+            f"key = (cls, {key})",
+            "ref = _cache.get(key)",
+            "if ref is not None:",
+            "    val = ref()",
+            "    if val is not None:",
+            "        return val",
+            "val = _base_new(cls)",
+            "_cache.store(key, val)",
+            "return val",
+        ]
+        return _BuildClasses._make_function(
             "__new__",
-            ["cls"] + list(fields),
-            ["return super(supertype, cls).__new__(cls)"],
-            supertype=supertype,
+            ["cls"] + [f.name for f in fields],
+            body,
+            # Resolve the parent __new__ (normally object.__new__) once, instead of
+            # walking the MRO through super() on every cache miss.
+            _base_new=super(supertype, supertype).__new__,
+            _cache=_MemoCache(),
         )
-        return _normalize(functools.lru_cache(maxsize=None)(new_function))
 
-    def _adt_class(self, *, name, base, fields: Union[List[str], OrderedDict]):
+    def _adt_class(self, *, name, base, fields: List[asdl.Field], concrete=True):
         basename = self.module.__name__  # pylint: disable=no-member
-        members = {
-            **({} if isinstance(fields, list) else {"__init__": self._init_fn(fields)}),
-            "__qualname__": f"{basename}.{name}",
-            "__annotations__": {f: None for f in fields},
-        }
+        names = _intern_names(tuple(f.name for f in fields))
 
         if mixin := self._mixin_types.get(name):
             base_types = (base, mixin)
         else:
             base_types = (base,)
 
-        cls = attrs.frozen(init=False)(type(name, base_types, members))
-        if cls.__name__ in self._memoize:
-            cls.__new__ = self._cached_new_fn(cls, fields)
+        # Abstract sum types get no slots of their own, so that mixins with slots can
+        # still be added to their constructors. Generated __hash__ methods cache their
+        # result in the "_hash" slot the first time they run.
+        slots = names
+        if concrete:
+            slots += ("_hash",)
+            if not any(b.__weakrefoffset__ for b in base_types):
+                slots += ("__weakref__",)
+
+        members = {
+            "__module__": basename,
+            "__qualname__": f"{basename}.{name}",
+            "__slots__": slots,
+            "__match_args__": names,
+        }
+
+        cls = type(name, base_types, members)
+        if concrete:
+            self._set_method(cls, self._eq_fn(names))
+            self._set_method(cls, self._hash_fn(cls, names))
+            if cls.__name__ in self._memoize:
+                self._set_method(cls, self._cached_new_fn(cls, fields))
+        self._set_method(cls, self._repr_fn(cls, names))
+        self._set_method(cls, self._update_fn(names))
         return cls
 
-    def _visit_fields(self, node, attributes=None):
-        validator_map = OrderedDict()
-        for field in node.fields + (attributes or []):
-            self.visit(field, validator_map)
+    def _visit_fields(self, fields: List[asdl.Field], attr_validators=None):
+        validator_map = {}
+        for field in fields:
+            self.visitField(field, validator_map)
+        if attr_validators:
+            validator_map.update(attr_validators)
+        if not self._checks:
+            # Types are still resolved above, so unknown names are reported.
+            return dict.fromkeys(validator_map)
         return validator_map
 
     # noinspection PyPep8Naming
@@ -165,23 +450,25 @@ class _BuildClasses(asdl.VisitorBase):
             # The "base" type is the actual, final type for products, but we cannot
             # create validators for the __init__ function until all the types have
             # been created, so we will wait until visitProduct is called later to
-            # attach it.
+            # attach it. Constructors likewise get their __init__ only once their
+            # class, and so its slot descriptors, exists.
             base_type = self._adt_class(
                 name=dfn.name,
                 base=_AsdlAdtBase,
                 fields=(
-                    [f.name for f in dfn.value.fields]
-                    if isinstance(dfn.value, asdl.Product)
-                    else []
+                    dfn.value.fields if isinstance(dfn.value, asdl.Product) else []
                 ),
+                concrete=isinstance(dfn.value, asdl.Product),
             )
             setattr(self.module, dfn.name, base_type)
-            self._base_types[dfn.name] = base_type
             self._type_map[dfn.name] = base_type
+            if isinstance(dfn.value, asdl.Sum):
+                self._ctor_types[base_type] = set()
 
-        # Fill in classes
+        # Fill in classes. The visit methods are called directly rather than through
+        # VisitorBase.visit, which looks the handler up by name on every call.
         for dfn in mod.dfns:
-            self.visit(dfn)
+            self.visitType(dfn)
 
     # noinspection PyPep8Naming
     # pylint: disable=invalid-name
@@ -189,7 +476,11 @@ class _BuildClasses(asdl.VisitorBase):
         """
         Forwards to either the sum or product handler
         """
-        self.visit(typ.value, self._base_types[typ.name])
+        base_type = self._type_map[typ.name]
+        if isinstance(typ.value, asdl.Sum):
+            self.visitSum(typ.value, base_type)
+        else:
+            self.visitProduct(typ.value, base_type)
 
     # noinspection PyPep8Naming
     # pylint: disable=invalid-name
@@ -197,10 +488,7 @@ class _BuildClasses(asdl.VisitorBase):
         """
         Creates a new data type for the current product type and adds it to the module.
         """
-        base_type.__init__ = self._init_fn(self._visit_fields(prod))
-        base_type.__abstractmethods__ = frozenset(
-            set(base_type.__abstractmethods__) - {"__init__"}
-        )
+        self._attach_init(base_type, self._visit_fields(prod.fields))
 
     # noinspection PyPep8Naming
     # pylint: disable=invalid-name
@@ -208,35 +496,77 @@ class _BuildClasses(asdl.VisitorBase):
         """
         Adds all the constructors associated with this sum type to the module.
         """
+        # Attribute validators are shared by every constructor, so build them once.
+        attr_validators = self._visit_fields(sum_node.attributes)
         for t in sum_node.types:
-            self.visit(t, base_type, sum_node.attributes)
+            self.visitConstructor(t, base_type, sum_node.attributes, attr_validators)
 
     # noinspection PyPep8Naming
     # pylint: disable=invalid-name
-    def visitConstructor(self, cons: asdl.Constructor, base_type, attributes):
+    def visitConstructor(
+        self, cons: asdl.Constructor, base_type, attributes, attr_validators
+    ):
         """
         Creates a new data type for the current constructor and adds it to the module.
         """
         ctor_type = self._adt_class(
-            name=cons.name,
-            base=base_type,
-            fields=self._visit_fields(cons, attributes),
+            name=cons.name, base=base_type, fields=cons.fields + (attributes or [])
         )
+        self._attach_init(ctor_type, self._visit_fields(cons.fields, attr_validators))
+        self._ctor_types[base_type].add(ctor_type)
         setattr(self.module, cons.name, ctor_type)
 
     # noinspection PyPep8Naming
     # pylint: disable=invalid-name
-    def visitField(self, field: asdl.Field, fields: OrderedDict):
+    def visitField(self, field: asdl.Field, fields: Dict[str, Any]):
         """
-        Updates the "fields" dict with a mapping from field name to validator.
+        Updates the "fields" dict with a mapping from field name to validator. Fields
+        of class types map to an _InlineCheck instead, to be checked inline.
         """
-        fields[field.name] = _make_validator(
-            self._get_point_validator(field), field.seq, field.opt
-        )
-
-    def _get_point_validator(self, field: asdl.Field):
-        point_validator = self._type_map[field.type]
+        point_type = self._type_map[field.type]
+
+        # An optional object accepts every value, so there is nothing to check.
+        if point_type is object and field.opt and not field.seq:
+            fields[field.name] = None
+            return
+
+        # instance_of() rejects None before its isinstance check, so classes that
+        # accept None are only inlined for object, which gets a None check instead.
+        if isinstance(point_type, type) and (
+            point_type is object or not isinstance(None, point_type)
+        ):
+            fields[field.name] = _InlineCheck(
+                point_type, field.seq, field.opt, self._ctor_types.get(point_type)
+            )
+            return
+
+        # Likewise for validators made by instance_of(), except for converting
+        # sequences, which are rebuilt element by element by their validator.
+        # They are recognised by identity, so wrappers copying their attributes are
+        # still called. Anything else falls through as object, which accepts None.
+        inst_type, convert = _instance_check(point_type) or (object, False)
+        if (
+            isinstance(inst_type, type)
+            and not isinstance(None, inst_type)
+            and not (convert and field.seq)
+        ):
+            fields[field.name] = _InlineCheck(
+                inst_type, field.seq, field.opt, convert=convert
+            )
+            return
+
+        # Fields of the same type and kind share one composed validator. It is keyed
+        # on the type's name, since user validators need not be hashable.
+        key = (field.type, field.seq, field.opt)
+        if (valid := self._validators.get(key)) is None:
+            valid = _make_validator(
+                self._get_point_validator(point_type), field.seq, field.opt
+            )
+            self._validators[key] = valid
+        fields[field.name] = valid
 
+    @staticmethod
+    def _get_point_validator(point_validator):
         if isinstance(point_validator, type):
             return instance_of(point_validator)
 
@@ -250,12 +580,31 @@ class _BuildClasses(asdl.VisitorBase):
         raise ValueError(f"Unknown validator type {type(point_validator)}")
 
 
+# Modules built by ADT(), keyed by its arguments, so repeated calls with the same
+# grammar skip parsing. Entries are only used while they are still the module
+# registered in sys.modules under their name.
+_adt_cache: Dict[tuple, ModuleType] = {}
+
+
+def _adt_key(asdl_str, ext_types, memoize, mixin_types, checks) -> tuple:
+    key = (
+        asdl_str,
+        frozenset((ext_types or {}).items()),
+        frozenset(memoize or ()),
+        frozenset((mixin_types or {}).items()),
+        checks,
+    )
+    hash(key)
+    return key
+
+
 def ADT(  # pylint: disable=invalid-name
     asdl_str: str,
     *,
     ext_types: Optional[Mapping[str, Union[type, Callable]]] = None,
     memoize: Optional[Collection[str]] = None,
     mixin_types: Optional[Mapping[str, type]] = None,
+    checks: bool = True,
 ):
     """
     Function that converts an ASDL grammar into a Python Module.
@@ -298,6 +647,11 @@ def ADT(  # pylint: disable=invalid-name
         A mapping of generated type names (matching the ASDL productions) to
         mixin classes from which to inherit. This is useful for injecting custom
         methods into the generated classes.
+    checks : bool
+        Whether generated constructors run their field validators, True by default.
+        Passing False is useful when the invariants of the grammar are maintained
+        by construction. Note that validators which convert their inputs (such as
+        instance_of(..., convert=True)) are then not applied either.
 
     Returns
     =================
@@ -317,26 +671,31 @@ def ADT(  # pylint: disable=invalid-name
             "id" : lambda x: type(x) is str and str.isalnum(),
         })
     """
+    try:
+        key = _adt_key(asdl_str, ext_types, memoize, mixin_types, checks)
+    except TypeError:  # unhashable option values are simply not cached
+        key = None
+
+    if (mod := _adt_cache.get(key)) and sys.modules.get(mod.__name__) is mod:
+        return mod
+
     asdl_ast = asdl.ASDLParser().parse(asdl_str)
     assert isinstance(asdl_ast, asdl.Module)
 
     if mod := sys.modules.get(asdl_ast.name):
         return mod
 
-    builder = _BuildClasses(ext_types, mixin_types, memoize)
+    builder = _BuildClasses(ext_types, mixin_types, memoize, checks)
     builder.visit(asdl_ast)
 
     mod = builder.module
     mod.__doc__ = (
-        textwrap.dedent(
-            """
-            ASDL Module generated by asdl_adt
-            Original ASDL description:
-            """
-        )
+        "\nASDL Module generated by asdl_adt\nOriginal ASDL description:\n"
         + textwrap.dedent(asdl_str)
     )
 
     sys.modules[asdl_ast.name] = mod
+    if key is not None:
+        _adt_cache[key] = mod
 
     return mod
@@ -2,7 +2,12 @@
 Common validators for custom types.
 """
 from functools import lru_cache
-from typing import Type
+from typing import Dict, Optional, Tuple, Type
+
+# Validators made by instance_of(), by id, with their checked type and conversion
+# flag. Each entry holds its validator, which instance_of() keeps alive anyway, so
+# an id is never reused while it is registered.
+_INSTANCE_CHECKS: Dict[int, Tuple[object, type, bool]] = {}
 
 
 class ValidationError(TypeError):
@@ -25,26 +30,47 @@ class ValidationError(TypeError):
         return f"expected: {expected}, actual: {actual}"
 
 
-@lru_cache(maxsize=0)
+@lru_cache(maxsize=None)
 def instance_of(typ, *, convert=False):
     """
-    Return a validator that checks if an object is an instance of the given type
+    Return a validator that checks if an object is an instance of the given type.
+    The validator is registered, so that ADT() can emit the same check inline.
     """
 
-    def _validator(obj):
-        if obj is not None:
-            if isinstance(obj, typ):
-                return obj
+    if convert:
 
-            if convert:
+        def _validator(obj):
+            if obj is not None:
+                if isinstance(obj, typ):
+                    return obj
                 return typ(obj)
 
-        raise ValidationError(typ, type(obj))
+            raise ValidationError(typ, type(obj))
+
+    else:
+
+        def _validator(obj):
+            if obj is not None and isinstance(obj, typ):
+                return obj
 
+            raise ValidationError(typ, type(obj))
+
+    _INSTANCE_CHECKS[id(_validator)] = (_validator, typ, convert)
     return _validator
 
 
-@lru_cache(maxsize=0)
+def _instance_check(validator) -> Optional[Tuple[type, bool]]:
+    """
+    Return the type and conversion flag of a validator made by instance_of(), or
+    None for any other object, including wrappers copying its attributes.
+    """
+    entry = _INSTANCE_CHECKS.get(id(validator))
+    if entry is None or entry[0] is not validator:
+        return None
+    return entry[1:]
+
+
+@lru_cache(maxsize=None)
 def subclass_of(typ):
     """
     Return a validator that checks if an object is a type inheriting from the given
@@ -67,3 +67,59 @@ def test_equal_objects_equal_hashes(simple_grammar):
     assert hash(simple_grammar.prod(0, 1)) == hash(simple_grammar.prod(0, 1))
     assert hash(simple_grammar.A(0)) == hash(simple_grammar.A(0))
     assert hash(simple_grammar.B(0.0)) == hash(simple_grammar.B(0.0))
+
+
+def test_equality_is_structural(simple_grammar):
+    """
+    Test that generated classes compare equal exactly when their types and field
+    values are equal.
+    """
+
+    assert simple_grammar.prod(0, 1) == simple_grammar.prod(0, 1)
+    assert simple_grammar.prod(0, 1) != simple_grammar.prod(1, 1)
+
+    # Same field names and arguments, but different types
+    assert simple_grammar.prod(0, 1) != simple_grammar.C(0, 1)
+    assert simple_grammar.A(0) != simple_grammar.B(0.0)
+
+
+def test_hash_is_cached(simple_grammar):
+    """
+    Test that generated classes compute their hash once and reuse it
+    """
+    obj = simple_grammar.C(3, 4)
+    value = hash(obj)
+
+    assert obj._hash == value  # pylint: disable=protected-access
+    assert hash(obj) == value
+
+
+def test_no_instance_dict(simple_grammar):
+    """
+    Test that generated classes store their fields only in slots
+    """
+    assert not hasattr(simple_grammar.prod(3, 4), "__dict__")
+    assert not hasattr(simple_grammar.A(3), "__dict__")
+
+
+def test_subclass_equality(simple_grammar, memo_grammar):
+    """
+    Test that instances of user subclasses of generated classes compare equal to
+    each other structurally, but not to instances of the generated class.
+    """
+
+    class SubC(simple_grammar.C):  # pylint: disable=C0115,R0903
+        pass
+
+    class SubProd(simple_grammar.prod):  # pylint: disable=C0115,R0903
+        pass
+
+    assert SubC(3, 4) == SubC(3, 4)
+    assert SubC(3, 4) != SubC(3, 5)
+    assert SubProd(3, 4) == SubProd(3, 4)
+    assert SubC(3, 4) != simple_grammar.C(3, 4)
+
+    class SubF(memo_grammar.F):  # pylint: disable=C0115,R0903
+        pass
+
+    assert SubF() == SubF()
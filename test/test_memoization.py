@@ -4,6 +4,12 @@ identical node, given equal arguments (which therefore will not necessarily comp
 identical via "is" to the resulting object's fields, themselves)
 """
 
+import gc
+import weakref
+
+from asdl_adt import ADT
+from asdl_adt.validators import instance_of
+
 
 def test_memoization(memo_grammar):
     """
@@ -38,3 +44,129 @@ def test_memoized_kwargs(memo_grammar):
     Test that the caching mechanism correctly handles keyword arguments
     """
     assert memo_grammar.B(3, 4) is memo_grammar.B(x=3, y=4)
+
+
+def test_memoized_sequence():
+    """
+    Test that memoized constructors with sequence fields are keyed on the contents
+    of the given lists.
+    """
+    test_adt = ADT(
+        """
+        module test_memoized_sequence {
+            prod = ( int* xs, int? y )
+        }
+        """,
+        memoize={"prod"},
+    )
+
+    assert test_adt.prod([1, 2], None) is test_adt.prod([1, 2], None)
+    assert test_adt.prod([1, 2], 3) is test_adt.prod([1, 2], 3)
+    assert test_adt.prod([1, 2], None) is not test_adt.prod([1, 3], None)
+
+
+def test_memoized_instances_are_collectable(memo_grammar):
+    """
+    Test that the memo table does not keep otherwise unreferenced nodes alive.
+    """
+    obj = memo_grammar.memo_prod(123, 456)
+    ref = weakref.ref(obj)
+    del obj
+    gc.collect()
+    assert ref() is None
+
+    assert memo_grammar.memo_prod(123, 456) == memo_grammar.memo_prod(123, 456)
+
+
+def test_memoized_fieldless(memo_grammar):
+    """
+    Test that a memoized constructor without fields always returns one instance,
+    even once no other references to it remain.
+    """
+    ref = weakref.ref(memo_grammar.A())
+    gc.collect()
+    assert ref() is memo_grammar.A()
+
+
+def test_memoized_equality(memo_grammar):
+    """
+    Test that memoized objects, which are equal exactly when identical, still compare
+    and hash consistently with their fields.
+    """
+    obj = memo_grammar.B(3, 4)
+    assert obj == memo_grammar.B(3, 4)
+    assert hash(obj) == hash(memo_grammar.B(3, 4))
+    assert obj != memo_grammar.B(4, 4)
+    assert obj != (3, 4)
+
+
+def test_memoized_converting_fields():
+    """
+    Test that memoized objects built from different arguments which convert to equal
+    field values still compare equal.
+    """
+    test_adt = ADT(
+        """
+        module test_memoized_converting_fields {
+            prod = ( name x )
+        }
+        """,
+        ext_types={"name": instance_of(str, convert=True)},
+        memoize={"prod"},
+    )
+
+    assert test_adt.prod(3) == test_adt.prod("3")
+    assert hash(test_adt.prod(3)) == hash(test_adt.prod("3"))
+
+
+def test_memoized_subclass(memo_grammar):
+    """
+    Test that subclasses of memoized classes are memoized separately from them.
+    """
+
+    class SubB(memo_grammar.B):  # pylint: disable=C0115,R0903
+        pass
+
+    sub_obj = SubB(7, 8)
+    assert not isinstance(memo_grammar.B(7, 8), SubB)
+    assert SubB(7, 8) is sub_obj
+    assert isinstance(SubB(3, 4), SubB)
+    assert not isinstance(memo_grammar.B(3, 4), SubB)
+
+
+def test_memoized_arguments_are_collectable():
+    """
+    Test that dropping a memoized object also releases its memo entry, and with it
+    the arguments it was built from.
+    """
+    test_adt = ADT(
+        """
+        module test_memoized_arguments_are_collectable {
+            node = Leaf( int val ) | Pair( node lhs, node rhs )
+        }
+        """,
+        memoize={"Leaf", "Pair"},
+    )
+
+    leaves = [test_adt.Leaf(i) for i in range(100)]
+    pairs = [test_adt.Pair(leaf, leaf) for leaf in leaves]
+    refs = [weakref.ref(leaf) for leaf in leaves]
+
+    del leaves, pairs
+    gc.collect()
+
+    assert all(ref() is None for ref in refs)
+
+
+def test_memoized_fieldless_subclass(memo_grammar):
+    """
+    Test that subclasses of memoized fieldless classes get an instance of their own.
+    """
+
+    class SubA(memo_grammar.A):  # pylint: disable=C0115,R0903
+        pass
+
+    memo_grammar.A()
+    assert isinstance(SubA(), SubA)
+    assert SubA() is SubA()
+    assert not isinstance(memo_grammar.A(), SubA)
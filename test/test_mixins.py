@@ -36,3 +36,61 @@ def test_basic_mixin():
 
     with pytest.raises(AttributeError, match="'B' object has no attribute 'double'"):
         mixin_grammar.B(3.14).double()
+
+
+def test_slotted_mixin():
+    """
+    Test that a mixin declaring empty __slots__ keeps instances free of a __dict__.
+    """
+
+    class MixinSum:  # pylint: disable=C0115,C0116,R0903
+        __slots__ = ()
+
+        def describe(self):
+            return f"{type(self).__name__}: {self.x}"
+
+    mixin_grammar = ADT(
+        """
+        module test_slotted_mixin {
+            sum = A( int x )
+                | B( int x, int y )
+        }
+        """,
+        mixin_types={
+            "A": MixinSum,
+        },
+    )
+
+    obj = mixin_grammar.A(3)
+    assert obj.describe() == "A: 3"
+    assert not hasattr(obj, "__dict__")
+
+
+def test_mixin_with_slots():
+    """
+    Test that mixins may declare slots of their own, on products and constructors.
+    """
+
+    class MixinWithSlots:  # pylint: disable=C0115,R0903
+        __slots__ = ("cache",)
+
+    mixin_grammar = ADT(
+        """
+        module test_mixin_with_slots {
+            prod = ( int x )
+            sum = A( int x )
+                | B( int x, int y )
+        }
+        """,
+        mixin_types={
+            "prod": MixinWithSlots,
+            "A": MixinWithSlots,
+        },
+    )
+
+    obj = mixin_grammar.A(3)
+    assert isinstance(obj, MixinWithSlots)
+    assert obj == mixin_grammar.A(3)
+    assert hash(obj) == hash(mixin_grammar.A(3))
+    assert not hasattr(obj, "__dict__")
+    assert mixin_grammar.prod(3).x == 3
@@ -2,6 +2,8 @@
 Coverage-focused test for object identity of same-named ADT types.
 """
 
+import sys
+
 from asdl_adt import ADT
 
 
@@ -14,3 +16,17 @@ def test_module_caching():
     grammar_a = ADT("module cache_test { foo = ( int bar ) }")
     grammar_b = ADT("module cache_test { foo = ( int bar ) }")
     assert grammar_a is grammar_b
+
+
+def test_module_caching_follows_sys_modules():
+    """
+    Test that a module removed from sys.modules is rebuilt rather than served from
+    the ADT() argument cache
+    """
+
+    grammar_a = ADT("module cache_evict_test { foo = ( int bar ) }")
+    del sys.modules["cache_evict_test"]
+    grammar_b = ADT("module cache_evict_test { foo = ( int bar ) }")
+    assert grammar_a is not grammar_b
+    assert sys.modules["cache_evict_test"] is grammar_b
+    assert ADT("module cache_evict_test { foo = ( int bar ) }") is grammar_b
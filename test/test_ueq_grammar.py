@@ -230,3 +230,27 @@ def test_invalid_arg_type_throws(ueq_grammar):
 
     assert exc_info.value.expected == List[ueq_grammar.pred]
     assert exc_info.value.actual == List[int]
+
+
+def test_match_args(ueq_grammar):
+    """
+    Test that generated classes support positional pattern matching, and that
+    classes with the same field names share their __match_args__.
+    """
+
+    assert ueq_grammar.problem.__match_args__ == ("holes", "knowns", "preds")
+    assert ueq_grammar.Scale.__match_args__ == ("coeff", "e")
+    assert ueq_grammar.Add.__match_args__ == ("lhs", "rhs")
+    assert ueq_grammar.Add.__match_args__ is ueq_grammar.Eq.__match_args__
+
+
+def test_repr(ueq_grammar):
+    """
+    Test that generated classes have a readable, constructor-like repr
+    """
+
+    eq_node = ueq_grammar.Eq(ueq_grammar.Var(Sym("x")), ueq_grammar.Const(3))
+    assert (
+        repr(eq_node) == "UEq.Eq(lhs=UEq.Var(name=Sym(name='x')), rhs=UEq.Const(val=3))"
+    )
+    assert repr(ueq_grammar.Conj([])) == "UEq.Conj(preds=[])"
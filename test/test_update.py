@@ -2,6 +2,10 @@
 Test incremental update functionality
 """
 
+import copy
+
+import pytest
+
 
 def test_update(simple_grammar):
     """
@@ -12,6 +16,22 @@ def test_update(simple_grammar):
     assert obj_before.update(y=6) == obj_after
 
 
+def test_update_subclass(simple_grammar):
+    """
+    Test that update on an instance of a user subclass returns that subclass
+    """
+
+    class SubC(simple_grammar.C):  # pylint: disable=too-few-public-methods
+        """User subclass of a generated constructor"""
+
+        __slots__ = ()
+
+    obj_updated = SubC(3, 4).update(x=5)
+
+    assert isinstance(obj_updated, SubC)
+    assert obj_updated == SubC(5, 4)
+
+
 def test_update_memoized_product(memo_grammar):
     """
     Test that update produces identical objects on memoized products
@@ -36,3 +56,32 @@ def test_update_memoized_sum(memo_grammar):
 
     assert obj_updated == obj_after
     assert obj_updated is obj_after
+
+
+def test_copy(simple_grammar, memo_grammar):
+    """
+    Test that copies of generated objects are equal to the original, and identical
+    to it for memoized types
+    """
+    obj = simple_grammar.C(3, 4)
+    assert copy.copy(obj) == obj
+    assert copy.deepcopy(obj) == obj
+
+    memo_obj = memo_grammar.B(3, 4)
+    assert copy.copy(memo_obj) is memo_obj
+    assert copy.deepcopy(memo_obj) is memo_obj
+
+
+def test_update_unknown_field(simple_grammar):
+    """
+    Test that update rejects names which are not fields of the type
+    """
+    with pytest.raises(TypeError):
+        simple_grammar.C(3, 4).update(z=6)
+
+
+def test_update_is_documented(simple_grammar):
+    """
+    Test that the generated update methods keep their docstring
+    """
+    assert "only certain fields changed" in simple_grammar.C.update.__doc__
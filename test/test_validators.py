@@ -3,14 +3,16 @@ Tests of validator edge cases
 """
 
 # pylint: disable=no-member
+import functools
 import re
+from dataclasses import dataclass
 from enum import Enum
 from typing import Type, List, Literal
 
 import pytest
 
 import asdl_adt
-from asdl_adt.validators import ValidationError, instance_of
+from asdl_adt.validators import ValidationError, instance_of, subclass_of
 
 
 def test_object_is_not_none():
@@ -188,3 +190,183 @@ def test_bad_validator():
             "module test_bad_validator { foo = ( name* x ) }",
             ext_types={"name": 3},
         )
+
+
+def test_builtin_scalar_types():
+    """
+    Test that plain fields of builtin scalar types are type-checked, including
+    against None.
+    """
+    test_adt = asdl_adt.ADT(
+        "module test_builtin_scalar_types { foo = ( int x, string y, bool z ) }"
+    )
+
+    assert isinstance(test_adt.foo(3, "bar", True), test_adt.foo)
+
+    with pytest.raises(ValidationError) as exc_info:
+        test_adt.foo(3.0, "bar", True)
+
+    assert exc_info.value.expected == int
+    assert exc_info.value.actual == float
+
+    with pytest.raises(ValidationError, match="expected: str, actual: NoneType"):
+        test_adt.foo(3, None, True)
+
+
+def test_checks_disabled():
+    """
+    Test that constructors skip validation entirely when checks are disabled.
+    """
+    test_adt = asdl_adt.ADT(
+        "module test_checks_disabled { foo = ( int x, sym* ys ) }",
+        ext_types={"sym": str},
+        checks=False,
+    )
+
+    obj = test_adt.foo("not-an-int", None)
+    assert obj.x == "not-an-int"
+    assert obj.ys is None
+
+
+def test_optional_scalar_type():
+    """
+    Test that optional fields of builtin scalar types accept None or the type.
+    """
+    test_adt = asdl_adt.ADT("module test_optional_scalar_type { foo = ( int? x ) }")
+
+    assert test_adt.foo(None).x is None
+    assert test_adt.foo(3).x == 3
+
+    with pytest.raises(ValidationError, match="expected: int, actual: str"):
+        test_adt.foo("bar")
+
+
+def test_validators_are_shared():
+    """
+    Test that validators for the same type and options are created only once.
+    """
+    assert instance_of(int) is instance_of(int)
+    assert instance_of(int) is not instance_of(int, convert=True)
+    assert subclass_of(int) is subclass_of(int)
+
+
+def test_sum_type_fields():
+    """
+    Test that sum-typed fields accept every constructor of the sum, and nothing else.
+    """
+    test_adt = asdl_adt.ADT(
+        """
+        module test_sum_type_fields {
+            expr = Lit(int v) | Neg(expr arg) | Add(expr* args)
+            stmt = Pass()
+        }
+        """
+    )
+
+    lit = test_adt.Lit(1)
+    assert test_adt.Neg(test_adt.Neg(lit)).arg.arg is lit
+    assert test_adt.Add([lit, test_adt.Neg(lit), test_adt.Add([])]).args[0] is lit
+
+    with pytest.raises(ValidationError, match="expected: test_sum_type_fields.expr"):
+        test_adt.Neg(test_adt.Pass())
+
+    with pytest.raises(ValidationError) as exc_info:
+        test_adt.Add([lit, 3])
+
+    assert exc_info.value.expected == List[test_adt.expr]
+    assert exc_info.value.actual == List[int]
+
+
+def test_converting_optional_field():
+    """
+    Test that instance_of(..., convert=True) converts optional values, but keeps
+    None as is.
+    """
+    test_adt = asdl_adt.ADT(
+        "module test_converting_optional_field { foo = ( name x, name? y ) }",
+        ext_types={"name": instance_of(str, convert=True)},
+    )
+
+    obj = test_adt.foo(3, None)
+    assert obj.x == "3"
+    assert obj.y is None
+    assert test_adt.foo("bar", 4).y == "4"
+
+    with pytest.raises(ValidationError, match="expected: str, actual: NoneType"):
+        test_adt.foo(None, None)
+
+
+def test_sequence_fields_are_copied():
+    """
+    Test that sequence fields do not alias the list they were constructed from,
+    whatever their element type.
+    """
+    test_adt = asdl_adt.ADT(
+        """
+        module test_sequence_fields_are_copied {
+            foo = ( int* xs, name* ys )
+        }
+        """,
+        ext_types={"name": instance_of(str, convert=True)},
+    )
+
+    ints, names = [1], ["a"]
+    obj = test_adt.foo(ints, names)
+    ints.append(2)
+    names.append("b")
+
+    assert obj.xs == [1]
+    assert obj.ys == ["a"]
+
+
+def test_unhashable_validator():
+    """
+    Test that callable objects may be used as validators even if they are not
+    hashable.
+    """
+
+    @dataclass
+    class InRange:  # pylint: disable=missing-class-docstring
+        low: int
+        high: int
+
+        def __call__(self, val):
+            if self.low <= val < self.high:
+                return val
+            raise ValidationError(f"[{self.low}, {self.high})", val)
+
+    test_adt = asdl_adt.ADT(
+        "module test_unhashable_validator { foo = ( rng* xs, rng? y ) }",
+        ext_types={"rng": InRange(0, 10)},
+    )
+
+    assert test_adt.foo([1, 2], None).xs == [1, 2]
+    with pytest.raises(ValidationError):
+        test_adt.foo([], 10)
+
+
+def test_wrapped_instance_of():
+    """
+    Test that a wrapper of an instance_of() validator is called rather than inlined,
+    even though functools.wraps copies the wrapped validator's attributes
+    """
+    is_str = instance_of(str)
+
+    @functools.wraps(is_str)
+    def non_empty_str(obj):
+        if obj == "":
+            raise ValidationError("non-empty str", obj)
+        return is_str(obj)
+
+    grammar = asdl_adt.ADT(
+        """
+        module wrapped {
+            name = ( str value )
+        }
+        """,
+        ext_types={"str": non_empty_str},
+    )
+
+    assert grammar.name("x").value == "x"
+    with pytest.raises(ValidationError):
+        grammar.name("")